@@ -1,34 +1,45 @@
 """Data class to define setup in SQL"""
+from dataclasses import dataclass, field
+
 from sqlalchemy import create_engine
-from dataclasses import dataclass
+from sqlalchemy.engine import Engine
+
 
-@dataclass
+@dataclass(slots=True)
 class SpiderIndexSQLSetup:
-    def __init__(self,**kwargs):
-        """Placeholder
-        """
-        property_defaults = {
-            'sql_engine_str':'postgresql+psycopg2',
-            'host':'localhost',
-            'database':'web_spider_data',
-            'user':'postgres',
-            'password':'postgres',
-            'port':'5432',
-            'db_index_schema':'raw',
-            'db_index_table_name':'indexing',
-            'unique_links_schema':'raw',
-            'unique_links_table_name':'unique_links'
-        }
-        for (prop, default) in property_defaults.items():
-            setattr(self,prop,kwargs.get(prop,default))
+    """Defines the PostgreSQL connection details and the
+    schema / table locations the web spider uses for indexing.
+
+    All fields have sensible local-dev defaults so the class can
+    be instantiated with no arguments. The sqlalchemy engine is
+    bound automatically after initialisation.
+    """
+
+    sql_engine_str: str = "postgresql+psycopg2"
+    host: str = "localhost"
+    database: str = "web_spider_data"
+    user: str = "postgres"
+    password: str = "postgres"
+    port: str = "5432"
+    db_index_schema: str = "raw"
+    db_index_table_name: str = "indexing"
+    unique_links_schema: str = "raw"
+    unique_links_table_name: str = "unique_links"
+    sql_engine: Engine = field(init=False, repr=False)
+
+    def __post_init__(self):
         self.bind_sql_engine()
-        
-        
+
     def bind_sql_engine(self):
-        """placeholder
+        """Creates the sqlalchemy engine with a connection pool
+        sized for the spider's batched uploads and the psycopg2
+        fast executemany path enabled
         """
-
-        engine = create_engine(
-            f"{self.sql_engine_str}://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+        self.sql_engine = create_engine(
+            f"{self.sql_engine_str}://{self.user}:{self.password}"
+            f"@{self.host}:{self.port}/{self.database}",
+            pool_size=8,
+            max_overflow=16,
+            pool_pre_ping=True,
+            executemany_mode="values_plus_batch",
         )
-        self.sql_engine = engine
\ No newline at end of file
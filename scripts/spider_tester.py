@@ -1,4 +1,6 @@
 """Module to test the spider and ensure it runs as intended"""
+import asyncio
+
 from spiders.web_spider_oo import WebSpider
 from db_connections.spider_indexing_dataclass import SpiderIndexSQLSetup
 
@@ -27,7 +29,7 @@ def test_spider_no_indexing():
         raw_files_save_path= r"/home/thedudefish/Desktop/spider_files/",
         pen_depth= 2
     )
-    spider.run_spider()
+    asyncio.run(spider.run_spider())
 
 def test_spider_no_indexing2():
     """Test the web spider on a simple website
@@ -38,7 +40,7 @@ def test_spider_no_indexing2():
         raw_files_save_path= r"/home/thedudefish/Desktop/spider_files/",
         pen_depth= 4
     )
-    spider.run_spider()
+    asyncio.run(spider.run_spider())
 
 def test_spider_no_indexing3():
     """Test the web spider on a simple website
@@ -49,7 +51,7 @@ def test_spider_no_indexing3():
         raw_files_save_path= r"/home/thedudefish/Desktop/spider_files/",
         pen_depth= 4
     )
-    spider.run_spider()
+    asyncio.run(spider.run_spider())
 
 def test_spider_no_indexing3():
     """Test the web spider on a simple website
@@ -63,7 +65,7 @@ def test_spider_no_indexing3():
         pen_depth= 1,
         indexing_definitions_obj=sql_setup_obj
     )
-    spider.run_spider()
+    asyncio.run(spider.run_spider())
 
 
 if __name__ == "__main__":
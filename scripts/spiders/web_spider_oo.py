@@ -23,17 +23,21 @@ TO DO:
 2. Run black and pylint
 """
 # Standard Library Imports
-import hashlib
-from itertools import product
-from random import randint
-from time import sleep
+import asyncio
+import csv
+import io
+import os
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 # 3rd Party Imports
+import ahocorasick
+import aiofiles
+import aiohttp
+from aiolimiter import AsyncLimiter
 from bs4 import BeautifulSoup
-import pandas as pd
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from psycopg2.extras import execute_values
+from pybloom_live import ScalableBloomFilter
+import xxhash
 
 # Custom Module Imports
 from db_connections.spider_indexing_dataclass import SpiderIndexSQLSetup
@@ -42,12 +46,30 @@ from db_connections.spider_indexing_dataclass import SpiderIndexSQLSetup
 class WebSpider:
     """Class to scrape text and PDF data from websites"""
 
+    # How many parent-child rows to accumulate before flushing
+    # to SQL with COPY. PostgreSQL insert throughput plateaus
+    # around this batch size so bigger buffers just cost memory.
+    PARENT_CHILD_FLUSH_ROWS = 10_000
+
+    # Batches at least this big go through COPY; anything smaller
+    # is cheaper as a single execute_values insert
+    COPY_ROW_THRESHOLD = 100
+
+    # Retry policy for transient fetch failures, matching the
+    # urllib3 Retry strategy the old requests session mounted
+    # (5 attempts, backoff factor 10, retry on these 5xx codes)
+    MAX_FETCH_ATTEMPTS = 5
+    RETRY_BACKOFF_S = 10
+    RETRY_STATUS_CODES = (500, 502, 503, 504)
+
     def __init__(
         self,
         root_site: str,
         pen_depth: int,
         raw_files_save_path: str,
         indexing_definitions_obj: SpiderIndexSQLSetup = None,
+        max_concurrency: int = 10,
+        max_requests_per_minute: float = 1,
     ):
         """Parameters are defined as follows:
 
@@ -66,10 +88,28 @@ class WebSpider:
         of unique links should be saved in SQL. Code to instantiate this
         class is included in this package. If not provided at instantiation,
         indexing will be turned off by default.
+
+        5. max_concurrency: Maximum number of pages the spider will
+        fetch at the same time. Keeps the spider from hammering
+        the web server with too many simultaneous requests.
+
+        6. max_requests_per_minute: Rate cap enforced by a token
+        bucket. Bursts up to the cap proceed immediately and only
+        requests over the cap wait, instead of every request paying
+        a fixed sleep. Raise this for sites / APIs with a published
+        rate limit.
         """
         self.root_site = root_site
         self.pen_depth = pen_depth
         self.raw_files_save_path = raw_files_save_path
+        self.max_concurrency = max_concurrency
+        self.max_requests_per_minute = max_requests_per_minute
+        # The root site never changes for the life of the spider, so
+        # sanitize and encode it once here rather than on every save
+        self._cleaned_root = (
+            root_site.replace("\\", "_").replace("/", "_").replace("?", "_").replace(":", "_")
+        )
+        self._root_bytes = root_site.encode()
 
         if indexing_definitions_obj is not None:
             try:
@@ -84,63 +124,162 @@ class WebSpider:
         else:
             self.indexing_on = False
 
-        self.unique_links_set = set()
+        # Approximate-membership dedup - a scalable Bloom filter
+        # stores ~10 bits per URL instead of the full string, at the
+        # cost of a tiny false-positive rate (a duplicate page may
+        # very occasionally be skipped, which is fine for a crawler)
+        self.unique_links_set = ScalableBloomFilter(
+            initial_capacity=10_000, error_rate=1e-4
+        )
+        if self.indexing_on:
+            # Rows waiting to be flushed to SQL in bulk. Unique links
+            # stream out as they are discovered so the exact list is
+            # never held in memory on top of the Bloom filter.
+            self._parent_child_buffer = []
+            self._unique_links_buffer = []
+            self._unique_link_count = 0
         self.bind_session_with_header()
         self.bind_filter_word_list()
 
-    def run_spider(self):
-        """Runs the web spider. Main routine for the class."""
-        for depth in range(self.pen_depth):
-            parent_level_links = {self.root_site} if depth == 0 else child_level_links
-            child_level_links = set()
-            for parent_link in parent_level_links:
-                print(f"Now working on {parent_link}...")
-                # Only capture each web page once
-                if parent_link in self.unique_links_set:
-                    continue
-                self.unique_links_set.add(parent_link)
-
-                site_request = self.get_request_with_delay(parent_link)
-                if site_request.status_code != 200:
-                    continue
-
-                # Save the raw file - text or PDF
-                if parent_link.lower().endswith("pdf"):
-                    self.save_webpage_as_pdf(parent_link, site_request)
-                elif parent_link.lower().endswith("xlsx"):
-                    continue
-                elif parent_link.lower().endswith("xls"):
-                    continue
-                else:
-                    self.save_webpage_as_text(parent_link, site_request)
-
-                # Transform - find and clean the links to keep the spider out of trouble
-                raw_child_links = self.get_all_links_from_page(site_request)
-                cleaned_child_links = self.clean_webpage_links(raw_child_links)
-                print(cleaned_child_links)
-                child_level_links.update(cleaned_child_links)
-
-                if self.indexing_on:
-                    # Record parent child link relationships
-                    parent_child_df = self.create_parent_child_dataframe(
-                        parent_link, child_level_links, depth
-                    )
-                    self.upload_data_to_sql(parent_child_df, flag="index")
+    async def run_spider(self):
+        """Runs the web spider. Main routine for the class.
 
+        Crawls with a work queue drained by a pool of worker tasks
+        rather than strict level-by-level passes - each worker pops
+        a (link, depth) pair, fetches the page, and enqueues its
+        first-seen children one level deeper until the penetration
+        depth is reached. With no barrier between levels, one slow
+        page never stalls the rest of the crawl.
+        """
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._limiter = AsyncLimiter(self.max_requests_per_minute, time_period=60)
+        self.failed_page_count = 0
+        work_queue = asyncio.Queue()
+        # Only capture each web page once. Child links are stored
+        # canonicalized, so seed the canonical form of the root too -
+        # otherwise the homepage reached again via a link like
+        # "/?utm_source=x" passes the membership test and gets
+        # fetched a second time. The original spelling is still what
+        # gets fetched and recorded.
+        self.unique_links_set.add(self.root_site)
+        self.unique_links_set.add(self._canonicalize(self.root_site))
         if self.indexing_on:
-            # Upload final list of unique links to sql
-            # As a dataframe
-            # Then dispose of the object
-            # NOTE: Need to add the child links to be included
-            self.unique_links_set.update(set(child_level_links))
-            unique_links_df = self.create_unique_links_df()
-            self.upload_data_to_sql(unique_links_df, flag="unique_links")
+            self._record_unique_link(self.root_site)
+        work_queue.put_nowait((self.root_site, 0))
+
+        async with aiohttp.ClientSession(headers=self.request_headers) as session:
+            self.session = session
+            workers = [
+                asyncio.create_task(self._crawl_worker(work_queue))
+                for _ in range(self.max_concurrency)
+            ]
+            # Wait for the queue to drain or for a worker to die on a
+            # non-network error - waiting on join() alone would hang
+            # forever if every worker crashed
+            queue_drained = asyncio.create_task(work_queue.join())
+            await asyncio.wait(
+                [queue_drained, *workers], return_when=asyncio.FIRST_COMPLETED
+            )
+            queue_drained.cancel()
+            for worker in workers:
+                worker.cancel()
+            worker_results = await asyncio.gather(*workers, return_exceptions=True)
+            for result in worker_results:
+                # Re-raise the first real worker crash (cancellation
+                # is not an Exception) so a misconfiguration can't
+                # masquerade as a completed crawl
+                if isinstance(result, Exception):
+                    raise result
+
+        if self.failed_page_count:
+            print(
+                f"{self.failed_page_count} page(s) permanently failed after retries"
+            )
+
+        if self.indexing_on:
+            # Flush whatever is still sitting in the buffers
+            # Then dispose of the engine
+            self.flush_parent_child_buffer()
+            self.flush_unique_links_buffer()
             self.indexing_definitions_obj.sql_engine.dispose()
 
-    def bind_session_with_header(self) -> requests.Session:
-        """Returns a session object with a predefined
-        user agent header. In the future authentication can
-        be added as well.
+    async def _crawl_worker(self, work_queue: asyncio.Queue):
+        """Single crawl worker - loops popping (link, depth) pairs
+        off the work queue and processing them until cancelled.
+        A page that fails with a network error (already retried by
+        get_request_with_delay) is counted and skipped so the crawl
+        keeps moving; anything else propagates and fails the crawl,
+        since an error that hits every page (e.g. a missing parser)
+        should not masquerade as a successful run.
+        """
+        while True:
+            parent_link, depth = await work_queue.get()
+            try:
+                await self.process_webpage(parent_link, depth, work_queue)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                self.failed_page_count += 1
+                print(f"Failed to fetch {parent_link}: {exc}")
+            finally:
+                work_queue.task_done()
+
+    async def process_webpage(
+        self, parent_link: str, depth: int, work_queue: asyncio.Queue
+    ):
+        """Fetches a single webpage, saves the raw file locally,
+        and enqueues first-seen child links at depth + 1 for the
+        worker pool to pick up.
+        """
+        print(f"Now working on {parent_link}...")
+        status_code, page_content = await self.get_request_with_delay(parent_link)
+        if status_code != 200:
+            return
+
+        # The URL extension picks the save handler
+        # (a None handler means skip the file type entirely)
+        extension = urlsplit(parent_link).path.rpartition(".")[2].lower()
+        save_handler = self._EXT_HANDLERS.get(extension, WebSpider.save_webpage_as_text)
+        if save_handler is None:
+            return
+        if save_handler is WebSpider.save_webpage_as_pdf:
+            await self.save_webpage_as_pdf(parent_link, page_content)
+            return
+
+        # Transform - one DOM build with two consumers: the links
+        # feed the crawl frontier and the extracted text (not the
+        # raw html) is what gets saved for downstream ingestion
+        raw_child_links, page_text = self.parse_webpage(page_content)
+        await self.save_webpage_as_text(parent_link, page_text.encode("utf-8"))
+        cleaned_child_links = self.clean_webpage_links(raw_child_links)
+        print(cleaned_child_links)
+
+        # Only capture each web page once. Children at the
+        # penetration depth are recorded but never fetched.
+        child_depth = depth + 1
+        for child_link in cleaned_child_links:
+            if child_link in self.unique_links_set:
+                continue
+            self.unique_links_set.add(child_link)
+            if self.indexing_on:
+                self._record_unique_link(child_link)
+            if child_depth < self.pen_depth:
+                work_queue.put_nowait((child_link, child_depth))
+
+        if self.indexing_on:
+            # Record parent child link relationships - buffered so SQL
+            # only sees one COPY per PARENT_CHILD_FLUSH_ROWS rows
+            # instead of one insert per page
+            self._parent_child_buffer.extend(
+                (depth, parent_link, child_link)
+                for child_link in cleaned_child_links
+            )
+            if len(self._parent_child_buffer) >= self.PARENT_CHILD_FLUSH_ROWS:
+                self.flush_parent_child_buffer()
+
+    def bind_session_with_header(self):
+        """Defines the headers used for the aiohttp session
+        with a predefined user agent. The session itself is
+        created inside run_spider so it lives on the event loop.
+        In the future authentication can be added as well.
         """
         agent = "".join(
             [
@@ -149,25 +288,7 @@ class WebSpider:
                 "Version/9.0.2 Safari/601.3.9",
             ]
         )
-        session = requests.Session()
-        headers = {"User-Agent": f"{agent}"}
-        session.headers.update(headers)
-        self.session = session
-        self.attach_retry_strategy_to_session()
-
-    def attach_retry_strategy_to_session(self):
-        retry_strategy = Retry(
-        total=5,  # Total number of retries
-        backoff_factor=10,  # Delay between retries (e.g., 1 second, 2 seconds, 4 seconds)
-        status_forcelist=[500, 502, 503, 504],  # HTTP status codes to retry on
-        allowed_methods=["GET"]  # Retry only on GET requests
-    )
-        # Create an HTTPAdapter using the Retry strategy
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-
-        # mount the adapter to session
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        self.request_headers = {"User-Agent": f"{agent}"}
 
     def bind_filter_word_list(self):
         """Defines a list of substrings
@@ -224,43 +345,74 @@ class WebSpider:
             "google"
         ]
         self.filter_word_list = filter_words_list
-
-    def get_request_with_delay(
+        # Aho-Corasick automaton scans each link in a single pass
+        # whose cost is independent of how many filter words are
+        # loaded, so per-site lists can grow without slowing cleanup
+        automaton = ahocorasick.Automaton()
+        for word in filter_words_list:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        self._filter_automaton = automaton
+
+    async def get_request_with_delay(
         self,
         parent_link,
-        min_delay_s=40,
-        max_delay_s=90,
         allow_redirects=False,
         timeout=20,
     ):
-        """Sends a get request to a webpage with a sleep
-        request before executing so it doesn't overload
-        the web server
-
-        Arguments for min_delay, max_delay etc. could hypothetically
-        be set at the instance instantiation level - something to
-        perhaps look at in the future but they seem fine here for now.
-
-        Returns the request
+        """Sends a get request to a webpage, paced by a token
+        bucket so it doesn't overload the web server. Requests
+        within the rate cap go straight through and only the excess
+        waits - the old fixed 40-90s sleep put a hard floor under
+        every single request. The semaphore bounds how many of these
+        coroutines can hold a connection at once.
+
+        Transient failures (connection errors, timeouts, and the
+        5xx codes in RETRY_STATUS_CODES) are retried with
+        exponential backoff up to MAX_FETCH_ATTEMPTS times, so one
+        flaky response doesn't permanently drop a page and the
+        subtree of links below it.
+
+        Returns the response status code and raw body bytes
+        (the response itself is released when the context closes)
         """
-        sleep(randint(min_delay_s, max_delay_s))
-        return self.session.get(
-            parent_link, allow_redirects=allow_redirects, timeout=timeout
-        )
+        async with self.semaphore:
+            for attempt in range(self.MAX_FETCH_ATTEMPTS):
+                backoff_s = self.RETRY_BACKOFF_S * 2**attempt
+                await self._limiter.acquire()
+                try:
+                    async with self.session.get(
+                        parent_link,
+                        allow_redirects=allow_redirects,
+                        timeout=aiohttp.ClientTimeout(total=timeout),
+                    ) as response:
+                        if (
+                            response.status in self.RETRY_STATUS_CODES
+                            and attempt < self.MAX_FETCH_ATTEMPTS - 1
+                        ):
+                            await asyncio.sleep(backoff_s)
+                            continue
+                        return response.status, await response.read()
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    if attempt == self.MAX_FETCH_ATTEMPTS - 1:
+                        raise
+                    await asyncio.sleep(backoff_s)
 
     @staticmethod
-    def get_all_links_from_page(
-        returned_request, parse_mode: str = "html.parser"
-    ) -> list:
-        """Returns all the <a> tag links from a single webpage
-        as a list of links
+    def parse_webpage(page_content: bytes, parse_mode: str = "lxml") -> tuple:
+        """Parses a webpage once and returns both the <a> tag links
+        and the visible page text
+
+        One lxml DOM build with two consumers - the spider used to
+        extract links from an anchors-only parse and then write the
+        raw html to disk, leaving a second full parse to whatever
+        ingested the files later. Extracting the text here also makes
+        the saved files roughly 10x smaller than the raw html.
         """
-        links_list = []
-        soup = BeautifulSoup(returned_request.content, parse_mode)
-        links = soup.find_all("a")
-        for link in links:
-            links_list.append(link.get("href"))
-        return links_list
+        soup = BeautifulSoup(page_content, parse_mode)
+        links_list = [link["href"] for link in soup.find_all("a", href=True)]
+        page_text = soup.get_text(" ", strip=True)
+        return links_list, page_text
 
     def clean_webpage_links(self, links_list: list) -> set:
         """Cleans the list of links from a single webpage
@@ -289,102 +441,194 @@ class WebSpider:
 
         FUTURE: add option to stay on website
         """
-        # Remove links with filtered words
-        filtered_links = [
-                            link for link in links_list \
-                                if link not in (None, "/")\
-                                    and not any(sub in (link or '') for sub in self.filter_word_list)
-                        ]
-        # Add root site to links in case of links like "/about-us" being returned
-        filtered_links = [self.root_site + link[1:] for link in filtered_links if link[0]=="/"]
-        return set(filtered_links)
-
-    def create_parent_child_dataframe(
-        self, parent_link: str, child_links: set,depth:int
-    ) -> pd.DataFrame:
-        """Creates a data structure (pandas dataframe)
-        to record parent-child relationships and depth
-        so the dataframe can be commited to SQL as the website
-        is scraped
-
-        First takes the depth, parent link, and list of child links and converts
-        it into a list of tuples to get all the combinations. Uses the products
-        function from the itertools library
-
-        Returns a dataframe with all the parent-child relationships for the parent link
+        # Single set-building pass: drop None / root / filtered
+        # links, join the surviving relative links (like "/about-us")
+        # onto the root site, and collapse equivalent spellings of
+        # the same URL so each page is only fetched and stored once
+        return {
+            self._canonicalize(self.root_site + link[1:])
+            for link in links_list
+            if link
+            and link != "/"
+            and link[0] == "/"
+            and not self._has_filter_word(link)
+        }
+
+    def _has_filter_word(self, link: str) -> bool:
+        """True if any filter word appears anywhere in the link.
+        Short-circuits on the first match found by the automaton.
         """
-        tuples_list = list(product([depth], [parent_link], child_links))
-        return pd.DataFrame(
-            tuples_list, columns=["pen_depth", "parent_link", "child_link"]
+        return next(self._filter_automaton.iter(link), None) is not None
+
+    @staticmethod
+    def _canonicalize(url: str) -> str:
+        """Reduces a URL to one canonical form so the same page
+        reached as e.g. http://site.com/p, http://site.com/p/ and
+        http://site.com/p?utm_source=x only occupies one slot in the
+        unique links set and only triggers one get request
+
+        Lowercases the host, strips default ports and trailing
+        slashes, and drops the fragment plus common tracking query
+        parameters (utm_*, fbclid, gclid)
+        """
+        scheme, netloc, path, query, _fragment = urlsplit(url)
+        netloc = netloc.lower()
+        if (scheme == "http" and netloc.endswith(":80")) or (
+            scheme == "https" and netloc.endswith(":443")
+        ):
+            netloc = netloc.rsplit(":", 1)[0]
+        kept_query_params = [
+            (key, value)
+            for key, value in parse_qsl(query)
+            if not key.startswith("utm_") and key not in ("fbclid", "gclid")
+        ]
+        return urlunsplit(
+            (scheme, netloc, path.rstrip("/"), urlencode(kept_query_params), "")
         )
 
-    def create_unique_links_df(self) -> pd.DataFrame:
-        """Converts the list of unique links
-        to a dataframe that can be uploaded to SQL
+    def flush_parent_child_buffer(self):
+        """Only applies if indexing is turned on.
+        Uploads the buffered parent-child rows - a full buffer goes
+        to PostgreSQL as a single COPY, which skips the
+        per-statement parse and planning overhead of issuing an
+        insert for every page
+        """
+        if not self._parent_child_buffer:
+            return
+        self.upload_data_to_sql(self._parent_child_buffer, flag="index")
+        self._parent_child_buffer.clear()
+
+    def _record_unique_link(self, link: str):
+        """Only applies if indexing is turned on.
+        Queues a first-seen link for the unique_links table with its
+        sequential link_id, flushing to SQL in bulk once enough rows
+        accumulate. Streaming at discovery time means the exact link
+        list never has to be materialized at the end of the crawl.
+        """
+        self._unique_links_buffer.append((self._unique_link_count, link))
+        self._unique_link_count += 1
+        if len(self._unique_links_buffer) >= self.PARENT_CHILD_FLUSH_ROWS:
+            self.flush_unique_links_buffer()
+
+    def flush_unique_links_buffer(self):
+        """Only applies if indexing is turned on.
+        Uploads the buffered unique link rows to PostgreSQL
+        """
+        if not self._unique_links_buffer:
+            return
+        self.upload_data_to_sql(self._unique_links_buffer, flag="unique_links")
+        self._unique_links_buffer.clear()
+
+    def _copy_rows_to_sql(self, schema: str, table_name: str, columns: tuple, rows):
+        """Streams rows of tuples into PostgreSQL with a single
+        COPY statement on a raw connection
         """
-        unique_link_tuples_list = list(enumerate(self.unique_links_set))
-        return pd.DataFrame(unique_link_tuples_list, columns=["link_id", "link_name"])
+        copy_buffer = io.StringIO()
+        csv.writer(copy_buffer, delimiter="\t").writerows(rows)
+        copy_buffer.seek(0)
 
-    def upload_data_to_sql(self, data_df: pd.DataFrame, flag: str):
+        raw_connection = self.indexing_definitions_obj.sql_engine.raw_connection()
+        try:
+            cursor = raw_connection.cursor()
+            cursor.copy_expert(
+                f"COPY {schema}.{table_name} ({', '.join(columns)}) "
+                "FROM STDIN WITH (FORMAT csv, DELIMITER E'\\t')",
+                copy_buffer,
+            )
+            raw_connection.commit()
+        finally:
+            raw_connection.close()
+
+    def upload_data_to_sql(self, rows: list, flag: str):
         """Only applies if indexing is turned on.
         Uploads data for child-parent link relationships
         and a list of unique links into SQL.
+
+        Takes the rows as plain tuples. Batches of at least
+        COPY_ROW_THRESHOLD rows stream through COPY; smaller batches
+        go through psycopg2's execute_values fast path, since a COPY
+        round trip isn't worth it for a handful of rows.
         """
         if flag == "index":
             table_name = self.indexing_definitions_obj.db_index_table_name
             schema = self.indexing_definitions_obj.db_index_schema
+            columns = ("pen_depth", "parent_link", "child_link")
 
         elif flag == "unique_links":
             table_name = self.indexing_definitions_obj.unique_links_table_name
             schema = self.indexing_definitions_obj.unique_links_schema
+            columns = ("link_id", "link_name")
         else:
             raise ValueError("Error: flag must be either 'index' or 'unique_links'")
 
-        data_df.to_sql(
-            name=table_name,
-            con=self.indexing_definitions_obj.sql_engine,
-            schema=schema,
-            if_exists="append",
-            index=False,
-            method="multi",
-        )
+        if len(rows) >= self.COPY_ROW_THRESHOLD:
+            self._copy_rows_to_sql(schema, table_name, columns, rows)
+            return
 
-    def save_webpage_as_text(self, web_url: str, returned_request):
-        """Saves webpage text locally as a .txt file"""
+        raw_connection = self.indexing_definitions_obj.sql_engine.raw_connection()
+        try:
+            cursor = raw_connection.cursor()
+            execute_values(
+                cursor,
+                f"INSERT INTO {schema}.{table_name} ({', '.join(columns)}) VALUES %s",
+                rows,
+                page_size=1000,
+            )
+            raw_connection.commit()
+        finally:
+            raw_connection.close()
+
+    async def save_webpage_as_text(self, web_url: str, text_content: bytes):
+        """Saves the extracted webpage text locally as a .txt file
+
+        Async file IO keeps the blocking open/write syscalls off the
+        event loop so disk writes overlap with in-flight requests.
+        The header and body are concatenated into one bytes object
+        so the whole page goes out in a single write call.
+        """
         save_name = self.generate_output_file_name(web_url, file_type_flag="txt")
-        soup = BeautifulSoup(returned_request.text,"html.parser")
-        with open(self.raw_files_save_path + save_name, "w") as file:
-            file.write(f"root_site:{self.root_site}" + "\n")
-            file.write(f"web_url:{web_url}" + "\n")
-            file.write(soup.text)
+        header = f"root_site:{self.root_site}\nweb_url:{web_url}\n".encode("utf-8")
+        save_path = os.path.join(self.raw_files_save_path, save_name)
+        async with aiofiles.open(save_path, "wb") as file:
+            await file.write(header + text_content)
 
-    def save_webpage_as_pdf(self, web_url: str, returned_request):
+    async def save_webpage_as_pdf(self, web_url: str, page_content: bytes):
         """Saves webpage pdf files locally as a .pdf file"""
         save_name = self.generate_output_file_name(web_url, file_type_flag="pdf")
-        with open(self.raw_files_save_path + save_name, "wb") as file:
-            file.write(returned_request.content)
+        save_path = os.path.join(self.raw_files_save_path, save_name)
+        async with aiofiles.open(save_path, "wb") as file:
+            await file.write(page_content)
+
+    # Maps URL extension to save handler. None means skip the file
+    # type; anything not listed is saved as text. Defined after the
+    # handlers so the class body can reference them directly.
+    _EXT_HANDLERS = {
+        "pdf": save_webpage_as_pdf,
+        "xls": None,
+        "xlsx": None,
+    }
 
     def generate_output_file_name(self, webpage: str, file_type_flag: str) -> str:
         """Gives each webpage a unique file name for saving locally
-        Unique name is a combination of parent site and unique md5 code
-        so for example: picabar.com.au_ab35322bc.txt
+        Unique name is a combination of parent site and a unique
+        xxhash code so for example: picabar.com.au_ab35322bc.txt
+
+        xxh3 is a non-cryptographic hash that runs far faster than
+        md5 - the hash here only disambiguates file names so there
+        is no security property to preserve
 
         Returns the unique name
 
         NOTE: Need to test for case with long root site name.
-        Max file name is 255 characters and md5 should be about 32 characters
-        so root site should be about 200 characters or less
+        Max file name is 255 characters and the hash is 16 characters
+        so root site should be about 230 characters or less
         """
         try:
             assert file_type_flag.lower() in ("pdf", "txt")
         except AssertionError as ae:
             raise ValueError("Error: flag must be pdf or text") from ae
-        cleaned_root = (
-            self.root_site.replace("\\", "_").replace("/", "_").replace("?", "_").replace(":","_")
-        )
-        cleaned_webpage = webpage.replace("\\", "_").replace("/", "_").replace("?", "_").replace(":","_")
-        #unique_url_hash = hashlib.md5((self.root_site + webpage).encode()).hexdigest()
+        unique_url_hash = xxhash.xxh3_64_hexdigest(self._root_bytes + webpage.encode())
         output_name = "".join(
-            [cleaned_root, "_", cleaned_webpage, ".", file_type_flag.lower()]
+            [self._cleaned_root, "_", unique_url_hash, ".", file_type_flag.lower()]
         )
         return output_name